@@ -5,16 +5,24 @@ Implements Path B from Module-5-MYE-Integration-Overview.md
 WARNING: This automation may violate Amazon's Terms of Service.
 Use at your own risk. Intended for testing purposes only.
 """
+import asyncio
+import itertools
 import os
 import time
 from typing import Dict, List, Optional
 from datetime import datetime
+import numpy as np
 from playwright.sync_api import Page, Browser, sync_playwright
+from scipy.stats import chi2, chi2_contingency
 from dotenv import load_dotenv
 import json
 
 load_dotenv()
 
+# Strips thousands separators, currency symbols and non-breaking spaces
+# from scraped numbers in one C-level pass
+_NUM_TABLE = str.maketrans("", "", ", $%\u00a0")
+
 
 class AmazonMYEAutomation:
     """
@@ -28,33 +36,123 @@ class AmazonMYEAutomation:
     5. Extract results and determine winners
     """
 
-    def __init__(self, headless: bool = False):
+    # Marker elements that signal a page is ready for the next step.
+    # Waiting on these instead of "networkidle" avoids multi-second stalls
+    # caused by ad/analytics requests on Seller Central pages.
+    NAV_MARKERS = {
+        "login": "input[type='email'], input#ap_email",
+        "password": "input[type='password'], input#ap_password",
+        "mye": "button:has-text('Create Experiment'), a:has-text('Create Experiment')",
+        "asin": "input[name*='asin'], input[placeholder*='ASIN']",
+        "metrics": "[data-variant='control'], [data-variant='treatment']",
+        "confirmation": "[data-test='experiment-id'], .experiment-id",
+    }
+
+    # Saved authenticated cookies; reused across runs so login can be skipped
+    STORAGE_STATE_PATH = ".auth/seller.json"
+    STORAGE_STATE_MAX_AGE = 24 * 3600  # seconds
+
+    # Form-field selectors reused across experiment creation calls
+    _SEL_SUBMIT = "input[type='submit'], button[type='submit']"
+    _SEL_CONTROL = "textarea[name*='control'], textarea:has-text('Control')"
+    _SEL_TREATMENT = "textarea[name*='treatment'], textarea:has-text('Treatment')"
+    _SEL_DURATION = "input[name*='duration'], input[type='number']"
+    _SEL_TRAFFIC = "input[name*='traffic'], input[name*='split']"
+    _SEL_LAUNCH = "button:has-text('Launch'), button:has-text('Create'), button:has-text('Start')"
+
+    # Resource types MYE scraping never needs; blocked via route interception
+    _BLOCKED_RESOURCES = {"image", "font", "media"}
+
+    # Experiment attribute -> display text shown in the MYE UI
+    _ATTRIBUTE_MAP = {
+        "TITLE": "Product Title",
+        "BULLET_1": "Bullet Point 1",
+        "BULLET_2": "Bullet Point 2",
+        "BULLET_3": "Bullet Point 3",
+        "BULLET_4": "Bullet Point 4",
+        "BULLET_5": "Bullet Point 5",
+    }
+
+    def __init__(self, headless: bool = True, block_styles: bool = False):
         self.headless = headless
+        # Stylesheet blocking is opt-in since some selectors may depend on
+        # computed styles (e.g. visibility checks)
+        self.block_styles = block_styles
         self.seller_central_url = os.getenv("SELLER_CENTRAL_URL", "https://sellercentral.amazon.com")
         self.mye_url = f"{self.seller_central_url}/advertising/manage-your-experiments"
         self.email = os.getenv("AMAZON_SELLER_EMAIL")
         self.password = os.getenv("AMAZON_SELLER_PASSWORD")
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
+        self.context = None
+        self._loc: Dict = {}
+        self._logged_in = False
+        self._ts_cache = (0, "")
+        # URL template of MYE's internal metrics endpoint, captured during
+        # the first DOM-based metrics fetch and reused for cheap JSON polls
+        self._metrics_api: Optional[str] = None
+        self._cdp = None
 
     def __enter__(self):
         """Context manager entry"""
         self.playwright = sync_playwright().start()
         self.browser = self.playwright.chromium.launch(headless=self.headless)
-        context = self.browser.new_context(
+        self.context = self.browser.new_context(
             viewport={"width": 1920, "height": 1080},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            storage_state=self._saved_storage_state()
+        )
+        blocked = self._BLOCKED_RESOURCES | ({"stylesheet"} if self.block_styles else set())
+        self.context.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in blocked
+            else route.continue_()
         )
-        self.page = context.new_page()
+        self.page = self.context.new_page()
+        # Build each Locator once so Playwright parses the multi-selector
+        # strings a single time instead of on every call in batch loops
+        self._loc = {
+            "email": self.page.locator(self.NAV_MARKERS["login"]),
+            "password": self.page.locator(self.NAV_MARKERS["password"]),
+            "submit": self.page.locator(self._SEL_SUBMIT),
+            "create": self.page.locator(self.NAV_MARKERS["mye"]),
+            "asin": self.page.locator(self.NAV_MARKERS["asin"]),
+            "control": self.page.locator(self._SEL_CONTROL),
+            "treatment": self.page.locator(self._SEL_TREATMENT),
+            "duration": self.page.locator(self._SEL_DURATION),
+            "traffic": self.page.locator(self._SEL_TRAFFIC),
+            "launch": self.page.locator(self._SEL_LAUNCH),
+        }
+        # Raw CDP session for the read-only polling paths: Runtime.evaluate
+        # over the devtools socket skips Playwright's orchestration layer
+        try:
+            self._cdp = self.context.new_cdp_session(self.page)
+        except Exception:
+            self._cdp = None  # CDP only available on Chromium
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
+        if self._logged_in and self.context:
+            # Persist authenticated cookies so the next run can skip login
+            os.makedirs(os.path.dirname(self.STORAGE_STATE_PATH), exist_ok=True)
+            self.context.storage_state(path=self.STORAGE_STATE_PATH)
         if self.browser:
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
 
+    def _saved_storage_state(self) -> Optional[str]:
+        """Return path to saved auth state if it exists and is fresh enough"""
+        try:
+            age = time.time() - os.path.getmtime(self.STORAGE_STATE_PATH)
+            if age < self.STORAGE_STATE_MAX_AGE:
+                return self.STORAGE_STATE_PATH
+        except OSError:
+            pass
+        return None
+
     def login(self, email: Optional[str] = None, password: Optional[str] = None) -> bool:
         """
         Login to Amazon Seller Central
@@ -74,28 +172,27 @@ class AmazonMYEAutomation:
 
         print(f"[{self._timestamp()}] Navigating to Seller Central...")
         self.page.goto(self.seller_central_url)
-        self.page.wait_for_load_state("networkidle")
 
         # Check if already logged in
         if "signin" not in self.page.url.lower():
             print(f"[{self._timestamp()}] Already logged in")
+            self._logged_in = True
             return True
 
         print(f"[{self._timestamp()}] Entering credentials...")
 
-        # Enter email
-        email_input = self.page.locator("input[type='email'], input#ap_email")
-        if email_input.is_visible():
-            email_input.fill(email)
-            self.page.locator("input[type='submit'], button[type='submit']").first.click()
-            self.page.wait_for_load_state("networkidle")
+        # Enter email; wait_for lets Playwright auto-wait in one round-trip
+        # instead of polling is_visible() first
+        email_input = self._loc["email"]
+        email_input.wait_for(state="visible", timeout=30000)
+        email_input.fill(email)
+        self._loc["submit"].first.click()
 
         # Enter password
-        password_input = self.page.locator("input[type='password'], input#ap_password")
-        if password_input.is_visible():
-            password_input.fill(password)
-            self.page.locator("input[type='submit'], button[type='submit']").first.click()
-            self.page.wait_for_load_state("networkidle")
+        password_input = self._loc["password"]
+        password_input.wait_for(state="visible", timeout=30000)
+        password_input.fill(password)
+        self._loc["submit"].first.click()
 
         # Handle 2FA if present
         if "mfa" in self.page.url.lower() or "verify" in self.page.url.lower():
@@ -103,13 +200,23 @@ class AmazonMYEAutomation:
             self.page.wait_for_url(lambda url: "mfa" not in url.lower(), timeout=120000)
 
         print(f"[{self._timestamp()}] Login successful")
+        self._logged_in = True
         return True
 
     def navigate_to_mye(self) -> None:
         """Navigate to Manage Your Experiments dashboard"""
         print(f"[{self._timestamp()}] Navigating to MYE dashboard...")
-        self.page.goto(self.mye_url)
-        self.page.wait_for_load_state("networkidle")
+        self._ensure_on(self.mye_url, self.NAV_MARKERS["mye"])
+
+    def _ensure_on(self, url_prefix: str, marker_selector: str) -> None:
+        """Navigate to url_prefix only if not already there, then wait for marker
+
+        Skipping the redundant goto saves a full page load per experiment
+        in batch loops that are already on the target page.
+        """
+        if not self.page.url.startswith(url_prefix):
+            self.page.goto(url_prefix)
+        self.page.wait_for_selector(marker_selector, state="visible", timeout=30000)
 
     def create_experiment(self,
                          asin: str,
@@ -134,61 +241,64 @@ class AmazonMYEAutomation:
         """
         print(f"[{self._timestamp()}] Creating experiment for ASIN {asin}...")
 
-        # Navigate to MYE
-        self.navigate_to_mye()
+        # Navigate to MYE (no-op if the page is already on the dashboard)
+        self._ensure_on(self.mye_url, self.NAV_MARKERS["mye"])
 
         # Click "Create Experiment" button
-        create_btn = self.page.locator("button:has-text('Create Experiment'), a:has-text('Create Experiment')")
-        create_btn.click()
-        self.page.wait_for_load_state("networkidle")
+        self._loc["create"].click()
+        self.page.wait_for_selector(self.NAV_MARKERS["asin"], state="visible", timeout=30000)
 
         # Enter ASIN
         print(f"[{self._timestamp()}] Selecting ASIN...")
-        asin_input = self.page.locator("input[name*='asin'], input[placeholder*='ASIN']")
+        asin_input = self._loc["asin"]
         asin_input.fill(asin)
         asin_input.press("Enter")
-        time.sleep(2)  # Wait for ASIN validation
+
+        # Wait for the validation result element instead of a fixed sleep:
+        # returns as soon as validation completes, however fast or slow
+        self.page.wait_for_selector(
+            "[data-test='asin-valid'], [data-test='asin-error'], .asin-validation-complete",
+            timeout=10000
+        )
+        if self.page.locator("[data-test='asin-error']").count() > 0:
+            raise ValueError(f"ASIN {asin} failed validation")
 
         # Select attribute (Title, Bullet Point, etc.)
         print(f"[{self._timestamp()}] Selecting attribute: {attribute}...")
-        attribute_map = {
-            "TITLE": "Product Title",
-            "BULLET_1": "Bullet Point 1",
-            "BULLET_2": "Bullet Point 2",
-            "BULLET_3": "Bullet Point 3",
-            "BULLET_4": "Bullet Point 4",
-            "BULLET_5": "Bullet Point 5",
-        }
-        attribute_display = attribute_map.get(attribute, "Product Title")
+        attribute_display = self._ATTRIBUTE_MAP.get(attribute, "Product Title")
         self.page.locator(f"text={attribute_display}").click()
 
         # Enter control variant
         print(f"[{self._timestamp()}] Entering control variant...")
-        control_input = self.page.locator("textarea[name*='control'], textarea:has-text('Control')").first
+        control_input = self._loc["control"].first
         control_input.fill(control_text)
 
         # Enter treatment variant
         print(f"[{self._timestamp()}] Entering treatment variant...")
-        treatment_input = self.page.locator("textarea[name*='treatment'], textarea:has-text('Treatment')").first
+        treatment_input = self._loc["treatment"].first
         treatment_input.fill(treatment_text)
 
         # Set duration
         print(f"[{self._timestamp()}] Setting duration: {duration_days} days...")
-        duration_input = self.page.locator("input[name*='duration'], input[type='number']")
-        if duration_input.is_visible():
+        # These fields may legitimately be absent, so probe with count()
+        # (a plain round-trip) rather than is_visible()'s rendering wait
+        duration_input = self._loc["duration"]
+        if duration_input.count() > 0:
             duration_input.fill(str(duration_days))
 
         # Set traffic split
         print(f"[{self._timestamp()}] Setting traffic split: {traffic_split}/{100-traffic_split}...")
-        traffic_input = self.page.locator("input[name*='traffic'], input[name*='split']")
-        if traffic_input.is_visible():
+        traffic_input = self._loc["traffic"]
+        if traffic_input.count() > 0:
             traffic_input.fill(str(traffic_split))
 
         # Review and launch
         print(f"[{self._timestamp()}] Launching experiment...")
-        launch_btn = self.page.locator("button:has-text('Launch'), button:has-text('Create'), button:has-text('Start')")
-        launch_btn.click()
-        self.page.wait_for_load_state("networkidle")
+        self._loc["launch"].click()
+        try:
+            self.page.wait_for_selector(self.NAV_MARKERS["confirmation"], timeout=30000)
+        except Exception:
+            pass  # Fall through to URL/timestamp-based ID extraction
 
         # Extract experiment ID from URL or page
         experiment_id = self._extract_experiment_id()
@@ -208,6 +318,40 @@ class AmazonMYEAutomation:
         print(f"[{self._timestamp()}] Experiment created: {experiment_id}")
         return experiment_metadata
 
+    def run_batch(self, cases: List[Dict]) -> List[Dict]:
+        """
+        Create experiments for multiple ASINs in one logged-in session
+
+        Logs in once and reuses the same page for every case, so the
+        Chromium launch and login cost is paid once per batch instead of
+        once per experiment.
+
+        Args:
+            cases: List of dicts with asin, control_text, treatment_text
+                   (plus optional attribute, duration_days, traffic_split)
+
+        Returns:
+            List of experiment metadata dicts
+        """
+        print(f"[{self._timestamp()}] Running batch of {len(cases)} experiments...")
+
+        self.login()
+
+        results = []
+        for case in cases:
+            metadata = self.create_experiment(
+                asin=case["asin"],
+                attribute=case.get("attribute", "TITLE"),
+                control_text=case["control_text"],
+                treatment_text=case["treatment_text"],
+                duration_days=case.get("duration_days", 28),
+                traffic_split=case.get("traffic_split", 50)
+            )
+            results.append(metadata)
+
+        print(f"[{self._timestamp()}] Batch complete: {len(results)} experiments created")
+        return results
+
     def get_experiment_metrics(self, experiment_id: str) -> Dict:
         """
         Fetch daily metrics for an experiment
@@ -220,19 +364,82 @@ class AmazonMYEAutomation:
         """
         print(f"[{self._timestamp()}] Fetching metrics for experiment {experiment_id}...")
 
-        # Navigate to experiment details page
-        self.page.goto(f"{self.mye_url}/{experiment_id}")
-        self.page.wait_for_load_state("networkidle")
+        # Fast path: poll the captured JSON endpoint, skipping the full
+        # page navigation and DOM build entirely
+        if self._metrics_api:
+            metrics = self._get_metrics_via_api(experiment_id)
+            if metrics is not None:
+                print(f"[{self._timestamp()}] Metrics extracted (JSON API)")
+                return metrics
+            self._metrics_api = None  # Endpoint expired (e.g. 401); re-capture
+
+        # DOM path: navigate to the experiment page, capturing the metrics
+        # XHR endpoint along the way so subsequent polls can use the fast path
+        listener = self._make_endpoint_capturer(experiment_id)
+        self.page.on("requestfinished", listener)
+        try:
+            self.page.goto(f"{self.mye_url}/{experiment_id}")
+            self.page.wait_for_selector(self.NAV_MARKERS["metrics"], state="visible", timeout=30000)
+
+            # Extract metrics table
+            metrics = {
+                "experiment_id": experiment_id,
+                "date": datetime.now().date().isoformat(),
+                "control": self._extract_variant_metrics("control"),
+                "treatment": self._extract_variant_metrics("treatment")
+            }
+        finally:
+            self.page.remove_listener("requestfinished", listener)
+
+        print(f"[{self._timestamp()}] Metrics extracted")
+        return metrics
+
+    def _make_endpoint_capturer(self, experiment_id: str):
+        """Build a request listener that records the metrics XHR endpoint"""
+        def _on_request_finished(request):
+            url = request.url
+            if (request.resource_type in ("xhr", "fetch")
+                    and experiment_id in url
+                    and "metric" in url.lower()):
+                self._metrics_api = url.replace(experiment_id, "{experiment_id}")
+        return _on_request_finished
+
+    def _get_metrics_via_api(self, experiment_id: str) -> Optional[Dict]:
+        """Fetch metrics from the captured JSON endpoint
+
+        Returns None on any failure so the caller can fall back to the
+        DOM-based extraction path.
+        """
+        try:
+            response = self.context.request.get(
+                self._metrics_api.format(experiment_id=experiment_id)
+            )
+            if not response.ok:
+                return None
+            data = response.json()
+        except Exception:
+            return None
 
-        # Extract metrics table
         metrics = {
             "experiment_id": experiment_id,
-            "date": datetime.now().date().isoformat(),
-            "control": self._extract_variant_metrics("control"),
-            "treatment": self._extract_variant_metrics("treatment")
+            "date": datetime.now().date().isoformat()
         }
-
-        print(f"[{self._timestamp()}] Metrics extracted")
+        for variant in ("control", "treatment"):
+            variant_data = data.get(variant, {})
+            impressions = int(variant_data.get("impressions", 0))
+            clicks = int(variant_data.get("clicks", 0))
+            units_ordered = int(variant_data.get("units", variant_data.get("units_ordered", 0)))
+
+            ctr = (clicks / impressions * 100) if impressions > 0 else 0
+            cvr = (units_ordered / clicks * 100) if clicks > 0 else 0
+
+            metrics[variant] = {
+                "impressions": impressions,
+                "clicks": clicks,
+                "ctr": round(ctr, 2),
+                "units_ordered": units_ordered,
+                "cvr": round(cvr, 2)
+            }
         return metrics
 
     def get_all_experiments(self) -> List[Dict]:
@@ -244,21 +451,26 @@ class AmazonMYEAutomation:
         """
         print(f"[{self._timestamp()}] Fetching all experiments...")
 
-        self.navigate_to_mye()
-
-        experiments = []
-
-        # Find experiment table/list
-        rows = self.page.locator("table tbody tr, div[data-test='experiment-row']").all()
-
-        for row in rows:
-            exp = {
-                "experiment_id": self._extract_text(row, "[data-test='experiment-id']"),
-                "asin": self._extract_text(row, "[data-test='asin']"),
-                "status": self._extract_text(row, "[data-test='status']"),
-                "created": self._extract_text(row, "[data-test='created-date']")
-            }
-            experiments.append(exp)
+        self._ensure_on(self.mye_url, self.NAV_MARKERS["mye"])
+
+        # Walk all rows in a single evaluate call: one CDP round-trip
+        # instead of four per row
+        experiments = self._evaluate_js(
+            """(() => Array.from(
+                document.querySelectorAll("table tbody tr, div[data-test='experiment-row']")
+            ).map(row => {
+                const text = (selector) => {
+                    const el = row.querySelector(selector);
+                    return el ? el.textContent.trim() : '';
+                };
+                return {
+                    experiment_id: text("[data-test='experiment-id']"),
+                    asin: text("[data-test='asin']"),
+                    status: text("[data-test='status']"),
+                    created: text("[data-test='created-date']")
+                };
+            }))()"""
+        )
 
         print(f"[{self._timestamp()}] Found {len(experiments)} experiments")
         return experiments
@@ -291,13 +503,87 @@ class AmazonMYEAutomation:
             "confidence": self._calculate_statistical_significance(control, treatment)
         }
 
+    def determine_winners_batch(self, metrics_list: List[Dict]) -> List[Dict]:
+        """
+        Determine winners for many experiments in one vectorized pass
+
+        Packs all CTR/CVR values into a structured NumPy array and computes
+        lifts and winners with array ops instead of N per-dict Python calls;
+        significance comes from the vectorized batch_analyze.
+
+        Args:
+            metrics_list: List of metrics dicts (as from get_experiment_metrics)
+
+        Returns:
+            List of winner analysis dicts, in input order
+        """
+        if not metrics_list:
+            return []
+
+        # float64 so lifts round identically to the scalar determine_winner
+        dtype = np.dtype([
+            ("c_ctr", "f8"), ("t_ctr", "f8"), ("c_cvr", "f8"), ("t_cvr", "f8")
+        ])
+        rates = np.fromiter(
+            (
+                (m["control"]["ctr"], m["treatment"]["ctr"],
+                 m["control"]["cvr"], m["treatment"]["cvr"])
+                for m in metrics_list
+            ),
+            dtype=dtype,
+            count=len(metrics_list)
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ctr_lift = np.where(
+                rates["c_ctr"] > 0,
+                (rates["t_ctr"] - rates["c_ctr"]) / rates["c_ctr"] * 100,
+                0.0
+            )
+            cvr_lift = np.where(
+                rates["c_cvr"] > 0,
+                (rates["t_cvr"] - rates["c_cvr"]) / rates["c_cvr"] * 100,
+                0.0
+            )
+        winners = np.where((ctr_lift > 0) & (cvr_lift >= 0), "TREATMENT", "CONTROL")
+
+        significance = self.batch_analyze(metrics_list)
+
+        return [
+            {
+                "winner": str(winner),
+                "ctr_lift_percent": round(float(ctr), 2),
+                "cvr_lift_percent": round(float(cvr), 2),
+                "recommendation": "APPLY" if winner == "TREATMENT" else "ROLLBACK",
+                "confidence": sig["confidence"]
+            }
+            for winner, ctr, cvr, sig in zip(winners, ctr_lift, cvr_lift, significance)
+        ]
+
     def _extract_variant_metrics(self, variant_type: str) -> Dict:
-        """Extract metrics for a specific variant from MYE page"""
-        selector_prefix = f"[data-variant='{variant_type}']"
+        """Extract metrics for a specific variant from MYE page
 
-        impressions = self._extract_number(f"{selector_prefix} [data-metric='impressions']")
-        clicks = self._extract_number(f"{selector_prefix} [data-metric='clicks']")
-        units_ordered = self._extract_number(f"{selector_prefix} [data-metric='units']")
+        Reads all three counters in a single evaluate call (one CDP
+        round-trip and one DOM traversal) instead of three separate locators.
+        """
+        data = self._evaluate_js(
+            f"""(() => {{
+                const root = document.querySelector("[data-variant='{variant_type}']");
+                const num = (metric) => {{
+                    const el = root && root.querySelector(`[data-metric='${{metric}}']`);
+                    return parseInt((el ? el.textContent : '0').replace(/,/g, ''), 10) || 0;
+                }};
+                return {{
+                    impressions: num('impressions'),
+                    clicks: num('clicks'),
+                    units: num('units')
+                }};
+            }})()"""
+        )
+
+        impressions = data["impressions"]
+        clicks = data["clicks"]
+        units_ordered = data["units"]
 
         ctr = (clicks / impressions * 100) if impressions > 0 else 0
         cvr = (units_ordered / clicks * 100) if clicks > 0 else 0
@@ -325,44 +611,265 @@ class AmazonMYEAutomation:
         # Generate timestamp-based ID as fallback
         return f"EXP_{int(time.time())}"
 
-    def _extract_text(self, element, selector: str) -> str:
-        """Extract text from element with selector"""
-        try:
-            return element.locator(selector).text_content().strip()
-        except:
-            return ""
+    def _evaluate_js(self, expression: str):
+        """Evaluate a JS expression, preferring the raw CDP session
+
+        Used on the read-only polling paths (metrics, experiment listing)
+        where per-command overhead adds up; form fills stay on Playwright's
+        higher-level auto-waiting API.
+        """
+        if self._cdp is not None:
+            result = self._cdp.send("Runtime.evaluate", {
+                "expression": expression,
+                "returnByValue": True
+            })
+            return result["result"]["value"]
+        return self.page.evaluate(expression)
 
     def _extract_number(self, selector: str) -> int:
         """Extract number from page element"""
         try:
             text = self.page.locator(selector).text_content().strip()
-            return int(text.replace(",", ""))
+            return int(text.translate(_NUM_TABLE)) if text else 0
         except:
             return 0
 
     def _calculate_statistical_significance(self, control: Dict, treatment: Dict) -> str:
         """
         Calculate statistical significance of results
-        Simple chi-squared test for CTR
+        Chi-squared test on the 2x2 click/no-click contingency table
         """
-        # This is a simplified version
-        # For production, use scipy.stats.chi2_contingency
+        table = np.array([
+            [control["clicks"], control["impressions"] - control["clicks"]],
+            [treatment["clicks"], treatment["impressions"] - treatment["clicks"]]
+        ])
 
-        total_control = control["impressions"]
-        total_treatment = treatment["impressions"]
-
-        if total_control < 100 or total_treatment < 100:
+        # Degenerate tables (no traffic, or all clicks/no clicks) carry no signal
+        if (table < 0).any() or table.sum(axis=1).min() == 0 or table.sum(axis=0).min() == 0:
             return "LOW"
-        elif total_control >= 1000 and total_treatment >= 1000:
+
+        _, p_value, _, _ = chi2_contingency(table)
+        return self._confidence_bucket(p_value)
+
+    @staticmethod
+    def _confidence_bucket(p_value: float) -> str:
+        """Map a p-value to a confidence label"""
+        if p_value < 0.01:
             return "HIGH"
-        else:
+        elif p_value < 0.05:
             return "MEDIUM"
+        else:
+            return "LOW"
+
+    def batch_analyze(self, metrics_list: List[Dict]) -> List[Dict]:
+        """
+        Compute statistical significance for many experiments in one pass
+
+        Stacks all 2x2 contingency tables into a (N, 2, 2) array and runs
+        the chi-squared test (with Yates correction, matching
+        scipy.stats.chi2_contingency for 2x2 tables) as vectorized NumPy
+        operations instead of N per-experiment Python calls.
+
+        Args:
+            metrics_list: List of metrics dicts (as from get_experiment_metrics)
+
+        Returns:
+            List of dicts with experiment_id, p_value and confidence
+        """
+        if not metrics_list:
+            return []
+
+        tables = np.array([
+            [
+                [m["control"]["clicks"],
+                 m["control"]["impressions"] - m["control"]["clicks"]],
+                [m["treatment"]["clicks"],
+                 m["treatment"]["impressions"] - m["treatment"]["clicks"]]
+            ]
+            for m in metrics_list
+        ], dtype=np.float64)
+
+        row_totals = tables.sum(axis=2, keepdims=True)
+        col_totals = tables.sum(axis=1, keepdims=True)
+        totals = tables.sum(axis=(1, 2), keepdims=True)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            expected = row_totals * col_totals / totals
+            stat = np.where(
+                expected > 0,
+                (np.abs(tables - expected) - 0.5).clip(min=0) ** 2 / expected,
+                0
+            ).sum(axis=(1, 2))
+
+        p_values = chi2.sf(stat, df=1)
+        degenerate = (
+            (tables < 0).any(axis=(1, 2))
+            | (row_totals.min(axis=(1, 2)) == 0)
+            | (col_totals.min(axis=(1, 2)) == 0)
+        )
+
+        return [
+            {
+                "experiment_id": m.get("experiment_id"),
+                "p_value": 1.0 if bad else round(float(p), 4),
+                "confidence": "LOW" if bad else self._confidence_bucket(float(p))
+            }
+            for m, p, bad in zip(metrics_list, p_values, degenerate)
+        ]
 
     def _timestamp(self) -> str:
-        """Get formatted timestamp"""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Get formatted timestamp, cached per wall-clock second
+
+        Log lines frequently land within the same second, so reformatting
+        via strftime on every call is wasted work.
+        """
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S"))
+        return self._ts_cache[1]
+
+    def save_snapshot(self, filename: str, include_accessibility: bool = False) -> None:
+        """Save current DOM state for debugging
+
+        Serializing the DOM is far cheaper than rendering a screenshot
+        (no paint or image encode), and usually enough to debug a failed
+        automation step.
+
+        Args:
+            filename: Output .html path
+            include_accessibility: Also write the accessibility tree as
+                a .json file alongside the HTML
+        """
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(self.page.content())
+        if include_accessibility:
+            with open(f"{os.path.splitext(filename)[0]}.json", "w", encoding="utf-8") as f:
+                json.dump(self.page.accessibility.snapshot(), f, indent=2)
+        print(f"[{self._timestamp()}] Snapshot saved: {filename}")
 
     def take_screenshot(self, filename: str) -> None:
-        """Take screenshot of current page"""
-        self.page.screenshot(path=filename)
+        """Take screenshot of current page
+
+        Prefer save_snapshot() unless a visual rendering is actually needed;
+        a screenshot costs a full paint plus image encode.
+        """
+        self.page.screenshot(path=filename, full_page=False, type="jpeg", quality=60)
         print(f"[{self._timestamp()}] Screenshot saved: {filename}")
+
+
+async def _create_experiment_async(context, case: Dict, semaphore: asyncio.Semaphore,
+                                   mye_url: str) -> Dict:
+    """Create a single experiment on its own page within a shared context"""
+    async with semaphore:
+        page = await context.new_page()
+        try:
+            await page.goto(mye_url)
+            await page.wait_for_selector(AmazonMYEAutomation.NAV_MARKERS["mye"],
+                                         state="visible", timeout=30000)
+            await page.click(AmazonMYEAutomation.NAV_MARKERS["mye"])
+            await page.wait_for_selector(AmazonMYEAutomation.NAV_MARKERS["asin"],
+                                         state="visible", timeout=30000)
+
+            await page.fill(AmazonMYEAutomation.NAV_MARKERS["asin"], case["asin"])
+            await page.press(AmazonMYEAutomation.NAV_MARKERS["asin"], "Enter")
+
+            # Wait for ASIN validation, as in the sync create_experiment
+            await page.wait_for_selector(
+                "[data-test='asin-valid'], [data-test='asin-error'], .asin-validation-complete",
+                timeout=10000
+            )
+            if await page.locator("[data-test='asin-error']").count() > 0:
+                raise ValueError(f"ASIN {case['asin']} failed validation")
+
+            attribute = case.get("attribute", "TITLE")
+            attribute_display = AmazonMYEAutomation._ATTRIBUTE_MAP.get(
+                attribute, "Product Title")
+            await page.click(f"text={attribute_display}")
+
+            await page.fill(AmazonMYEAutomation._SEL_CONTROL, case["control_text"])
+            await page.fill(AmazonMYEAutomation._SEL_TREATMENT, case["treatment_text"])
+
+            # Duration/traffic fields may legitimately be absent, so probe
+            # with count() as the sync path does
+            duration_input = page.locator(AmazonMYEAutomation._SEL_DURATION)
+            if await duration_input.count() > 0:
+                await duration_input.fill(str(case.get("duration_days", 28)))
+            traffic_input = page.locator(AmazonMYEAutomation._SEL_TRAFFIC)
+            if await traffic_input.count() > 0:
+                await traffic_input.fill(str(case.get("traffic_split", 50)))
+
+            await page.click(AmazonMYEAutomation._SEL_LAUNCH)
+            try:
+                await page.wait_for_selector(
+                    AmazonMYEAutomation.NAV_MARKERS["confirmation"], timeout=30000)
+            except Exception:
+                pass
+
+            # Extract experiment ID from URL, with timestamp fallback
+            experiment_id = f"EXP_{int(time.time())}"
+            if "experiment" in page.url:
+                parts = page.url.split("/")
+                experiment_id = parts[-1] if parts[-1] else parts[-2]
+
+            return {
+                "experiment_id": experiment_id,
+                "asin": case["asin"],
+                "attribute": attribute,
+                "control_text": case["control_text"],
+                "treatment_text": case["treatment_text"],
+                "duration_days": case.get("duration_days", 28),
+                "traffic_split": case.get("traffic_split", 50),
+                "created_at": datetime.now().isoformat(),
+                "status": "RUNNING"
+            }
+        finally:
+            await page.close()
+
+
+async def run_batch_parallel(cases: List[Dict],
+                             concurrency: int = 4,
+                             headless: bool = True,
+                             storage_state: Optional[str] = None) -> List[Dict]:
+    """
+    Create experiments for multiple ASINs concurrently
+
+    Runs up to `concurrency` experiments at once, each in its own
+    BrowserContext inside a single Chromium process, so the batch gets a
+    near-linear speedup at roughly one browser's worth of memory.
+
+    Args:
+        cases: List of dicts with asin, control_text, treatment_text
+        concurrency: Number of contexts working in parallel
+        headless: Run Chromium headless
+        storage_state: Path to a saved authenticated storage state
+                       (captured from a previous logged-in session)
+
+    Returns:
+        List of experiment metadata dicts, in input order
+    """
+    from playwright.async_api import async_playwright
+
+    seller_central_url = os.getenv("SELLER_CENTRAL_URL", "https://sellercentral.amazon.com")
+    mye_url = f"{seller_central_url}/advertising/manage-your-experiments"
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+        contexts = [
+            await browser.new_context(
+                viewport={"width": 1920, "height": 1080},
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                storage_state=storage_state
+            )
+            for _ in range(min(concurrency, len(cases)) or 1)
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        try:
+            results = await asyncio.gather(*(
+                _create_experiment_async(context, case, semaphore, mye_url)
+                for context, case in zip(itertools.cycle(contexts), cases)
+            ))
+        finally:
+            await browser.close()
+
+    return list(results)
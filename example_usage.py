@@ -4,19 +4,30 @@ Example Usage: Running MYE Experiments with SLO Listings
 This script demonstrates the complete workflow for testing
 SLO-generated listings on Amazon MYE.
 """
+import sys
+from amazon_mye_automation import AmazonMYEAutomation
 from mye_experiment_runner import MYEExperimentRunner
 from lqs_integration import LQSIntegration
 
+BORDER = "=" * 60
+
+
+def _emit(lines):
+    """Write a block of output lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _header(title):
+    return ["", BORDER, title, BORDER, ""]
+
 
 def example_1_basic_experiment():
     """
     Example 1: Run a basic Title experiment
     """
-    print("\n" + "="*60)
-    print("EXAMPLE 1: Basic Title Experiment")
-    print("="*60 + "\n")
+    _emit(_header("EXAMPLE 1: Basic Title Experiment"))
 
-    runner = MYEExperimentRunner(headless=False)
+    runner = MYEExperimentRunner()
 
     result = runner.run_experiment(
         asin="B01EXAMPLE",
@@ -25,23 +36,23 @@ def example_1_basic_experiment():
         duration_days=28
     )
 
-    print("\nResult:")
-    print(f"Status: {result['status']}")
+    lines = ["", "Result:", f"Status: {result['status']}"]
     if result['status'] == 'RUNNING':
-        print(f"Experiment ID: {result['experiment_id']}")
-        print(f"LQS Score: {result['lqs_validation']['lqs']}")
-        print(f"Grade: {result['lqs_validation']['grade']}")
+        lines += [
+            f"Experiment ID: {result['experiment_id']}",
+            f"LQS Score: {result['lqs_validation']['lqs']}",
+            f"Grade: {result['lqs_validation']['grade']}"
+        ]
     elif result['status'] == 'BLOCKED':
-        print(f"Reason: {result['reason']}")
+        lines.append(f"Reason: {result['reason']}")
+    _emit(lines)
 
 
 def example_2_lqs_validation_only():
     """
     Example 2: Validate listing with LQS without creating experiment
     """
-    print("\n" + "="*60)
-    print("EXAMPLE 2: LQS Validation Only")
-    print("="*60 + "\n")
+    _emit(_header("EXAMPLE 2: LQS Validation Only"))
 
     lqs = LQSIntegration()
 
@@ -59,21 +70,23 @@ def example_2_lqs_validation_only():
 
     result = lqs.calculate_lqs("B01EXAMPLE", listing_data)
 
-    print("LQS Score:", result["lqs"])
-    print("Grade:", result["grade"])
-    print("MYE Eligible:", result["mye_eligible"])
-    print("\nDimension Breakdown:")
+    lines = [
+        f"LQS Score: {result['lqs']}",
+        f"Grade: {result['grade']}",
+        f"MYE Eligible: {result['mye_eligible']}",
+        "",
+        "Dimension Breakdown:"
+    ]
     for dim_name, dim_data in result["dimensions"].items():
-        print(f"  {dim_name}: {dim_data['score']}/100 (weight: {dim_data['weight']*100}%)")
+        lines.append(f"  {dim_name}: {dim_data['score']}/100 (weight: {dim_data['weight']*100}%)")
+    _emit(lines)
 
 
 def example_3_validate_before_experiment():
     """
     Example 3: Pre-validate, then only run experiment if passes
     """
-    print("\n" + "="*60)
-    print("EXAMPLE 3: Pre-validate Before Creating Experiment")
-    print("="*60 + "\n")
+    _emit(_header("EXAMPLE 3: Pre-validate Before Creating Experiment"))
 
     lqs = LQSIntegration()
 
@@ -86,23 +99,24 @@ def example_3_validate_before_experiment():
     # Pre-validate
     validation = lqs.validate_for_mye("B01EXAMPLE", treatment_data)
 
-    print(f"LQS Score: {validation['lqs']}")
-    print(f"MYE Eligible: {validation['eligible']}")
+    lines = [
+        f"LQS Score: {validation['lqs']}",
+        f"MYE Eligible: {validation['eligible']}"
+    ]
 
     if not validation["eligible"]:
-        print("\n❌ Listing does not meet MYE eligibility criteria")
-        print("\nBlockers:")
-        for blocker in validation["blockers"]:
-            print(f"  - {blocker}")
-        print("\nRecommendations:")
-        for rec in validation["recommendations"]:
-            print(f"  - {rec}")
-        print("\nExperiment NOT created")
+        lines += ["", "❌ Listing does not meet MYE eligibility criteria", "", "Blockers:"]
+        lines += [f"  - {blocker}" for blocker in validation["blockers"]]
+        lines += ["", "Recommendations:"]
+        lines += [f"  - {rec}" for rec in validation["recommendations"]]
+        lines += ["", "Experiment NOT created"]
+        _emit(lines)
         return
 
-    print("\n✓ Listing passes - proceeding to create experiment...")
+    lines += ["", "✓ Listing passes - proceeding to create experiment..."]
+    _emit(lines)
 
-    runner = MYEExperimentRunner(headless=False)
+    runner = MYEExperimentRunner()
     result = runner.run_experiment(
         asin="B01EXAMPLE",
         control_title="Old Title",
@@ -110,84 +124,88 @@ def example_3_validate_before_experiment():
         duration_days=28
     )
 
-    print(f"Experiment Status: {result['status']}")
+    _emit([f"Experiment Status: {result['status']}"])
 
 
 def example_4_collect_metrics():
     """
     Example 4: Collect metrics for an existing experiment
     """
-    print("\n" + "="*60)
-    print("EXAMPLE 4: Collect Experiment Metrics")
-    print("="*60 + "\n")
+    _emit(_header("EXAMPLE 4: Collect Experiment Metrics"))
 
-    runner = MYEExperimentRunner(headless=False)
+    runner = MYEExperimentRunner()
 
     # Replace with actual experiment ID
     experiment_id = "EXP_123456"
 
-    print(f"Collecting metrics for experiment: {experiment_id}")
+    _emit([f"Collecting metrics for experiment: {experiment_id}"])
 
     result = runner.collect_metrics(experiment_id)
 
-    print("\nControl Variant:")
-    print(f"  Impressions: {result['metrics']['control']['impressions']:,}")
-    print(f"  Clicks: {result['metrics']['control']['clicks']:,}")
-    print(f"  CTR: {result['metrics']['control']['ctr']}%")
-    print(f"  Units Ordered: {result['metrics']['control']['units_ordered']:,}")
-    print(f"  CVR: {result['metrics']['control']['cvr']}%")
-
-    print("\nTreatment Variant:")
-    print(f"  Impressions: {result['metrics']['treatment']['impressions']:,}")
-    print(f"  Clicks: {result['metrics']['treatment']['clicks']:,}")
-    print(f"  CTR: {result['metrics']['treatment']['ctr']}%")
-    print(f"  Units Ordered: {result['metrics']['treatment']['units_ordered']:,}")
-    print(f"  CVR: {result['metrics']['treatment']['cvr']}%")
-
-    print("\nAnalysis:")
-    print(f"  Winner: {result['analysis']['winner']}")
-    print(f"  CTR Lift: {result['analysis']['ctr_lift_percent']}%")
-    print(f"  CVR Lift: {result['analysis']['cvr_lift_percent']}%")
-    print(f"  Recommendation: {result['analysis']['recommendation']}")
-    print(f"  Confidence: {result['analysis']['confidence']}")
+    lines = []
+    for variant_label, variant_key in [("Control", "control"), ("Treatment", "treatment")]:
+        variant = result['metrics'][variant_key]
+        lines += [
+            "",
+            f"{variant_label} Variant:",
+            f"  Impressions: {variant['impressions']:,}",
+            f"  Clicks: {variant['clicks']:,}",
+            f"  CTR: {variant['ctr']}%",
+            f"  Units Ordered: {variant['units_ordered']:,}",
+            f"  CVR: {variant['cvr']}%"
+        ]
+
+    analysis = result['analysis']
+    lines += [
+        "",
+        "Analysis:",
+        f"  Winner: {analysis['winner']}",
+        f"  CTR Lift: {analysis['ctr_lift_percent']}%",
+        f"  CVR Lift: {analysis['cvr_lift_percent']}%",
+        f"  Recommendation: {analysis['recommendation']}",
+        f"  Confidence: {analysis['confidence']}"
+    ]
+    _emit(lines)
 
 
 def example_5_generate_report():
     """
     Example 5: Generate comprehensive report
     """
-    print("\n" + "="*60)
-    print("EXAMPLE 5: Generate Experiment Report")
-    print("="*60 + "\n")
+    _emit(_header("EXAMPLE 5: Generate Experiment Report"))
 
-    runner = MYEExperimentRunner(headless=False)
+    runner = MYEExperimentRunner()
 
     # Replace with actual experiment ID
     experiment_id = "EXP_123456"
 
     report = runner.generate_report(experiment_id)
 
-    print("Experiment Report")
-    print("-" * 60)
-    print(f"Experiment ID: {report['experiment_id']}")
-    print(f"ASIN: {report['asin']}")
-    print(f"Created: {report['created_at']}")
-    print(f"\nLQS Score: {report['lqs_score']} ({report['lqs_grade']})")
-    print(f"\nControl Title:\n  {report['control_title']}")
-    print(f"\nTreatment Title:\n  {report['treatment_title']}")
-    print(f"\nRecommendation: {report['recommendation']}")
-    print(f"CTR Lift: {report['analysis']['ctr_lift_percent']}%")
+    _emit([
+        "Experiment Report",
+        "-" * 60,
+        f"Experiment ID: {report['experiment_id']}",
+        f"ASIN: {report['asin']}",
+        f"Created: {report['created_at']}",
+        "",
+        f"LQS Score: {report['lqs_score']} ({report['lqs_grade']})",
+        "",
+        f"Control Title:\n  {report['control_title']}",
+        "",
+        f"Treatment Title:\n  {report['treatment_title']}",
+        "",
+        f"Recommendation: {report['recommendation']}",
+        f"CTR Lift: {report['analysis']['ctr_lift_percent']}%"
+    ])
 
 
 def example_6_batch_experiments():
     """
     Example 6: Run experiments for multiple ASINs
     """
-    print("\n" + "="*60)
-    print("EXAMPLE 6: Batch Processing Multiple ASINs")
-    print("="*60 + "\n")
+    _emit(_header("EXAMPLE 6: Batch Processing Multiple ASINs"))
 
-    runner = MYEExperimentRunner(headless=False)
+    lqs = LQSIntegration()
 
     # List of ASINs to test
     test_cases = [
@@ -204,51 +222,78 @@ def example_6_batch_experiments():
     ]
 
     results = []
+    eligible_cases = []
+    lines = []
 
+    # Validate all treatments up front (no browser needed)
     for case in test_cases:
-        print(f"\nProcessing ASIN: {case['asin']}")
-
-        result = runner.run_experiment(
-            asin=case['asin'],
-            control_title=case['control'],
-            treatment_title=case['treatment'],
-            duration_days=28
-        )
-
-        results.append({
-            "asin": case['asin'],
-            "status": result['status'],
-            "experiment_id": result.get('experiment_id'),
-            "lqs": result.get('lqs_validation', {}).get('lqs')
-        })
-
-        print(f"  Status: {result['status']}")
+        lines.append(f"Validating ASIN: {case['asin']}")
 
-    print("\n" + "="*60)
-    print("BATCH RESULTS SUMMARY")
-    print("="*60)
+        validation = lqs.validate_for_mye(case['asin'], {
+            "title": case['treatment'],
+            "bullets": [],
+            "description": ""
+        })
 
+        if validation["eligible"]:
+            eligible_cases.append({
+                "asin": case['asin'],
+                "control_text": case['control'],
+                "treatment_text": case['treatment']
+            })
+        else:
+            results.append({
+                "asin": case['asin'],
+                "status": "BLOCKED",
+                "experiment_id": None,
+                "lqs": validation['lqs']
+            })
+            lines.append(f"  Status: BLOCKED (LQS {validation['lqs']})")
+    _emit(lines)
+
+    # One browser launch and one login for the whole batch
+    if eligible_cases:
+        with AmazonMYEAutomation(headless=True) as mye:
+            lines = []
+            for metadata in mye.run_batch(eligible_cases):
+                results.append({
+                    "asin": metadata['asin'],
+                    "status": metadata['status'],
+                    "experiment_id": metadata['experiment_id'],
+                    "lqs": None
+                })
+                lines.append(f"  {metadata['asin']}: {metadata['status']}")
+            _emit(lines)
+
+    lines = ["", BORDER, "BATCH RESULTS SUMMARY", BORDER]
     for r in results:
         status_icon = "✓" if r['status'] == 'RUNNING' else "❌"
-        print(f"{status_icon} {r['asin']}: {r['status']} (LQS: {r['lqs']})")
+        lines.append(f"{status_icon} {r['asin']}: {r['status']} (LQS: {r['lqs']})")
+    _emit(lines)
 
 
 def main():
     """
     Main menu for example selection
     """
-    print("\n" + "="*60)
-    print("SLO MYE Browser Automation - Example Usage")
-    print("="*60)
-    print("\nAvailable Examples:")
-    print("1. Basic Title Experiment")
-    print("2. LQS Validation Only")
-    print("3. Pre-validate Before Experiment")
-    print("4. Collect Experiment Metrics")
-    print("5. Generate Experiment Report")
-    print("6. Batch Process Multiple ASINs")
-    print("\nTo run an example, uncomment the function call below")
-    print("="*60 + "\n")
+    _emit([
+        "",
+        BORDER,
+        "SLO MYE Browser Automation - Example Usage",
+        BORDER,
+        "",
+        "Available Examples:",
+        "1. Basic Title Experiment",
+        "2. LQS Validation Only",
+        "3. Pre-validate Before Experiment",
+        "4. Collect Experiment Metrics",
+        "5. Generate Experiment Report",
+        "6. Batch Process Multiple ASINs",
+        "",
+        "To run an example, uncomment the function call below",
+        BORDER,
+        ""
+    ])
 
     # Uncomment the example you want to run:
     # example_1_basic_experiment()
@@ -258,7 +303,7 @@ def main():
     # example_5_generate_report()
     # example_6_batch_experiments()
 
-    print("Edit example_usage.py to uncomment and run specific examples")
+    _emit(["Edit example_usage.py to uncomment and run specific examples"])
 
 
 if __name__ == "__main__":
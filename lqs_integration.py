@@ -3,13 +3,123 @@ LQS (Listing Quality Score) Integration
 Validates SLO-generated listings meet MYE eligibility threshold (LQS >= 70)
 """
 import requests
-from typing import Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+import ahocorasick
+import aioboto3
+import asyncio
 import boto3
+import copy
+import hashlib
 import json
+import numpy as np
+import orjson
 import os
+from botocore.config import Config
 from dotenv import load_dotenv
+from numba import njit
 
-load_dotenv()
+
+_env_loaded = False
+
+
+def _load_env_once() -> None:
+    """Load the .env file at most once per process, and only on demand
+
+    load_dotenv walks the filesystem looking for a .env file; deferring
+    it out of module import means test modules that never construct an
+    LQSIntegration don't pay for it.
+    """
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+@dataclass(frozen=True)
+class _Config:
+    """Resolved environment configuration, read once per process"""
+    lqs_api_url: str
+    s3_bucket: str
+    s3_prefix: str
+    aws_region: str
+
+
+@lru_cache(maxsize=1)
+def _config() -> _Config:
+    _load_env_once()
+    return _Config(
+        lqs_api_url=os.getenv("LQS_API_URL", "https://lqs.krell.works/api"),
+        s3_bucket=os.getenv("S3_BUCKET", "acglogs"),
+        s3_prefix=os.getenv("S3_PREFIX", "listings/"),
+        aws_region=os.getenv("AWS_REGION", "us-east-1")
+    )
+
+# Dimension names and weights as parallel flat sequences (SoA); the public
+# dict-of-dicts breakdown is only materialized at the API boundary.
+# Weights are float64 to match the precision of the scalar path.
+_DIM_NAMES = (
+    "keyword_optimization", "usp_effectiveness", "readability",
+    "competitive_position", "customer_alignment", "compliance"
+)
+_DIM_WEIGHTS = np.array([0.25, 0.20, 0.15, 0.15, 0.15, 0.10], dtype=np.float64)
+
+
+@njit(cache=True, fastmath=True)
+def _weighted_lqs(scores):
+    """Weighted LQS per row of an (N, 6) score matrix
+
+    The dimension weights are baked in as literals (kept in sync with
+    _DIM_WEIGHTS) so Numba constant-folds them into straight-line
+    fused multiply-adds instead of looping over a weights array.
+    """
+    n = scores.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        out[i] = (0.25 * scores[i, 0] + 0.20 * scores[i, 1]
+                  + 0.15 * scores[i, 2] + 0.15 * scores[i, 3]
+                  + 0.15 * scores[i, 4] + 0.10 * scores[i, 5])
+    return out
+
+# A-Z -> a-z translation table; lowering pure-ASCII listing text through a
+# single bytes.translate pass is cheaper than per-bullet str.lower calls
+_ASCII_LOWER = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+# Scoring keyword sets, prebuilt lowercase so the per-listing scans never
+# rebuild the lists or re-lowercase the keywords
+_USP_KEYWORDS = frozenset({"unique", "patented", "exclusive", "only", "first", "proven"})
+_PAIN_POINT_KEYWORDS = frozenset({"solve", "eliminate", "prevent", "avoid", "reduce", "improve"})
+_BANNED_TERMS = frozenset({"#1", "best seller", "free shipping", "100% guarantee"})
+
+# Process-wide S3 client: constructing a boto3 client parses botocore
+# service models and opens a fresh HTTPS pool, so build it once and let
+# every LQSIntegration instance share the connection pool
+_S3_CLIENT = None
+
+
+def _get_s3_client():
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        _S3_CLIENT = boto3.client(
+            's3',
+            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+            region_name=_config().aws_region,
+            config=Config(
+                max_pool_connections=32,
+                tcp_keepalive=True,
+                retries={"max_attempts": 3, "mode": "adaptive"}
+            )
+        )
+    return _S3_CLIENT
+
+
+class _CacheEntry(NamedTuple):
+    """Memoized LQS result plus the ASIN it belongs to, for invalidation"""
+    asin: str
+    result: Dict
 
 
 class LQSIntegration:
@@ -23,65 +133,261 @@ class LQSIntegration:
     - No critical compliance failures
     """
 
+    # Fixed attribute layout: slot descriptors are faster than __dict__
+    # lookups and shave ~100 bytes per instance
+    __slots__ = ("lqs_api_url", "s3_bucket", "s3_prefix", "s3_client",
+                 "_automaton", "_lqs_cache")
+
     MYE_THRESHOLD = 70.0
 
+    # Upper bound on memoized LQS results (oldest evicted first)
+    LQS_CACHE_SIZE = 1024
+
+    # Grade thresholds as a binary-search lookup; label index is the number
+    # of bins the score clears
+    _GRADE_BINS = np.array([60, 70, 80, 90])
+    _GRADE_LABELS = np.array(["F", "D", "C", "B", "A"])
+
     def __init__(self):
-        self.lqs_api_url = os.getenv("LQS_API_URL", "https://lqs.krell.works/api")
-        self.s3_bucket = os.getenv("S3_BUCKET", "acglogs")
-        self.s3_prefix = os.getenv("S3_PREFIX", "listings/")
+        config = _config()
+        self.lqs_api_url = config.lqs_api_url
+        self.s3_bucket = config.s3_bucket
+        self.s3_prefix = config.s3_prefix
         self.s3_client = self._init_s3_client()
+        self._automaton = self._build_automaton()
+        # Memoized results keyed by content hash; retry loops and repeated
+        # validations of the same listing skip the six scoring passes
+        self._lqs_cache: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def _build_automaton():
+        """Build one Aho-Corasick automaton over all scoring keyword sets
+
+        A single automaton walk reports every USP, pain-point and banned-term
+        match in one linear scan, replacing the per-category nested keyword
+        loops.
+        """
+        automaton = ahocorasick.Automaton()
+        for category, keywords in (
+            ("usp", _USP_KEYWORDS),
+            ("pain", _PAIN_POINT_KEYWORDS),
+            ("banned", _BANNED_TERMS),
+        ):
+            for keyword in keywords:
+                automaton.add_word(keyword, (category, keyword))
+        automaton.make_automaton()
+        return automaton
+
+    def _keyword_counts(self, title: str, bullets: list) -> Dict:
+        """Count scoring keyword hits for all categories
+
+        Preserves the original scoring semantics: USP and pain-point
+        keywords count once per bullet they appear in, banned terms once
+        per listing (scanned over title + joined bullets, so terms may
+        span bullet boundaries as before).
+
+        The whole listing is case-folded in one pass — for pure-ASCII
+        text (the common case) via a single bytes.translate over the
+        concatenated buffer, with per-bullet views sliced back out of it
+        instead of lowercased one by one.
+        """
+        text = title + " " + " ".join(bullets)
+        if text.isascii():
+            folded = text.encode("ascii").translate(_ASCII_LOWER).decode("ascii")
+            start = len(title) + 1
+            lowered_bullets = []
+            for bullet in bullets:
+                lowered_bullets.append(folded[start:start + len(bullet)])
+                start += len(bullet) + 1
+        else:
+            folded = text.lower()
+            lowered_bullets = [bullet.lower() for bullet in bullets]
+
+        counts = {"usp": 0, "pain": 0}
+        for bullet in lowered_bullets:
+            seen = {tag for _, tag in self._automaton.iter(bullet)}
+            for category, _ in seen:
+                if category in counts:
+                    counts[category] += 1
+
+        counts["banned"] = len({
+            keyword for _, (category, keyword) in self._automaton.iter(folded)
+            if category == "banned"
+        })
+        return counts
 
     def _init_s3_client(self):
         """Initialize S3 client for reading listing data"""
-        return boto3.client(
-            's3',
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-            region_name=os.getenv("AWS_REGION", "us-east-1")
-        )
+        return _get_s3_client()
 
-    def calculate_lqs(self, asin: str, listing_data: Dict) -> Dict:
+    def calculate_lqs(self, asin: str, listing_data: Dict, full: bool = True) -> Dict:
         """
         Calculate Listing Quality Score for a listing
 
         Args:
             asin: Amazon ASIN
             listing_data: Dict with title, bullets, description
+            full: Include the per-dimension breakdown; pass False when only
+                the score/eligibility matters to skip building the nested
+                dicts
 
         Returns:
-            Dict with LQS score and 6-dimension breakdown
+            Dict with LQS score and (if full) 6-dimension breakdown
         """
-        # 6 Dimensions with weights
-        dimensions = {
-            "keyword_optimization": {"weight": 0.25, "score": 0},
-            "usp_effectiveness": {"weight": 0.20, "score": 0},
-            "readability": {"weight": 0.15, "score": 0},
-            "competitive_position": {"weight": 0.15, "score": 0},
-            "customer_alignment": {"weight": 0.15, "score": 0},
-            "compliance": {"weight": 0.10, "score": 0}
+        cache_key = (self._cache_key(asin, listing_data), full)
+        cached = self._lqs_cache.get(cache_key)
+        if cached is not None:
+            self._lqs_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached.result)
+
+        # Derive per-listing features once so no dimension has to re-scan
+        # the title or bullets: one automaton pass for keyword counts, one
+        # length pass over the bullets
+        title = listing_data.get("title", "")
+        bullets = listing_data.get("bullets", [])
+        counts = self._keyword_counts(title, bullets)
+        features = {
+            "title": title,
+            "title_len": len(title),
+            "bullet_total_len": sum(map(len, bullets))
         }
 
         # Calculate each dimension (simplified - actual LQS has complex logic)
-        dimensions["keyword_optimization"]["score"] = self._score_keyword_optimization(listing_data)
-        dimensions["usp_effectiveness"]["score"] = self._score_usp_effectiveness(listing_data)
-        dimensions["readability"]["score"] = self._score_readability(listing_data)
-        dimensions["competitive_position"]["score"] = self._score_competitive_position(asin, listing_data)
-        dimensions["customer_alignment"]["score"] = self._score_customer_alignment(listing_data)
-        dimensions["compliance"]["score"] = self._score_compliance(listing_data)
-
-        # Calculate weighted LQS
-        lqs = sum(
-            dim["score"] * dim["weight"]
-            for dim in dimensions.values()
-        )
-
-        return {
+        # into locals, in the fixed order matching _DIM_NAMES
+        s_keyword = self._score_keyword_optimization(features)
+        s_usp = self._score_usp_effectiveness(counts["usp"])
+        s_read = self._score_readability(features)
+        s_comp = self._score_competitive_position(asin, listing_data)
+        s_cust = self._score_customer_alignment(counts["pain"])
+        s_compl = self._score_compliance(counts["banned"])
+
+        # Weighted LQS, partial-evaluated with the weights as literals
+        # (kept in sync with _DIM_WEIGHTS) — straight-line arithmetic
+        # with no loop or array round-trip on the scalar path
+        lqs = (0.25 * s_keyword + 0.20 * s_usp + 0.15 * s_read
+               + 0.15 * s_comp + 0.15 * s_cust + 0.10 * s_compl)
+
+        result = {
             "asin": asin,
             "lqs": round(lqs, 1),
-            "dimensions": dimensions,
             "mye_eligible": lqs >= self.MYE_THRESHOLD,
             "grade": self._assign_grade(lqs)
         }
+        if full:
+            # Materialize the public dict-of-dicts breakdown only here,
+            # at the API boundary
+            scores = (s_keyword, s_usp, s_read, s_comp, s_cust, s_compl)
+            result["dimensions"] = {
+                name: {"weight": float(weight), "score": float(score)}
+                for name, weight, score in zip(_DIM_NAMES, _DIM_WEIGHTS, scores)
+            }
+
+        self._lqs_cache[cache_key] = _CacheEntry(asin, copy.deepcopy(result))
+        if len(self._lqs_cache) > self.LQS_CACHE_SIZE:
+            self._lqs_cache.popitem(last=False)
+
+        return result
+
+    def calculate_lqs_batch(self, asins: List[str], listings: List[Dict]) -> List[Dict]:
+        """
+        Calculate LQS for many listings in one vectorized pass
+
+        Pre-extracts title lengths, bullet-length totals and keyword counts
+        into flat arrays, then evaluates every dimension as NumPy vector
+        expressions and the weighted sums through the JIT kernel — a handful
+        of C-level array ops instead of N interpreted scoring calls.
+        Produces exactly the same result dicts as calculate_lqs.
+
+        Args:
+            asins: Amazon ASINs, parallel to listings
+            listings: Listing data dicts with title, bullets, description
+
+        Returns:
+            List of LQS result dicts, in input order
+        """
+        n = len(listings)
+        title_lens = np.fromiter(
+            (len(listing.get("title", "")) for listing in listings), np.int32, n
+        )
+        bullet_totals = np.fromiter(
+            (sum(map(len, listing.get("bullets", []))) for listing in listings), np.int32, n
+        )
+        has_separator = np.fromiter(
+            (any(char in listing.get("title", "") for char in ["|", ",", "-"])
+             for listing in listings),
+            np.bool_, n
+        )
+
+        # One automaton pass per listing -> (N, 3) usp/pain/banned counts
+        keyword_counts = np.empty((n, 3), dtype=np.int32)
+        for i, listing in enumerate(listings):
+            counts = self._keyword_counts(
+                listing.get("title", ""), listing.get("bullets", [])
+            )
+            keyword_counts[i] = (counts["usp"], counts["pain"], counts["banned"])
+
+        # Each dimension as a vector expression mirroring its _score_* method
+        keyword_optimization = (
+            np.where((title_lens > 80) & (title_lens <= 200), 50, 0)
+            + np.where(bullet_totals > 500, 50, 0)
+        )
+        usp_effectiveness = np.minimum(100, keyword_counts[:, 0] * 20 + 40)
+        readability = np.minimum(
+            100,
+            70
+            + np.where((title_lens >= 100) & (title_lens <= 180), 15, 0)
+            + np.where(has_separator, 15, 0)
+        )
+        competitive_position = np.full(n, 70.0)
+        customer_alignment = np.minimum(100, keyword_counts[:, 1] * 15 + 40)
+        compliance = np.where(
+            keyword_counts[:, 2] == 0, 100,
+            np.where(keyword_counts[:, 2] == 1, 80, 60)
+        )
+
+        scores = np.stack([
+            keyword_optimization, usp_effectiveness, readability,
+            competitive_position, customer_alignment, compliance
+        ], axis=1).astype(np.float64)
+        lqs_values = _weighted_lqs(np.ascontiguousarray(scores))
+
+        return [
+            {
+                "asin": asin,
+                "lqs": round(float(lqs), 1),
+                "mye_eligible": bool(lqs >= self.MYE_THRESHOLD),
+                "grade": self._assign_grade(float(lqs)),
+                "dimensions": {
+                    name: {"weight": float(weight), "score": float(score)}
+                    for name, weight, score in zip(_DIM_NAMES, _DIM_WEIGHTS, row)
+                }
+            }
+            for asin, lqs, row in zip(asins, lqs_values, scores)
+        ]
+
+    @staticmethod
+    def _cache_key(asin: str, listing_data: Dict) -> str:
+        """Content hash of everything that feeds into the LQS score"""
+        payload = json.dumps([
+            asin,
+            listing_data.get("title", ""),
+            listing_data.get("bullets", []),
+            listing_data.get("description", "")
+        ], sort_keys=True)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def invalidate(self, asin: Optional[str] = None) -> None:
+        """Drop cached LQS results, for all ASINs or just one
+
+        Args:
+            asin: ASIN to evict; None clears the whole cache
+        """
+        if asin is None:
+            self._lqs_cache.clear()
+        else:
+            for key in [k for k, entry in self._lqs_cache.items()
+                        if entry.asin == asin]:
+                del self._lqs_cache[key]
 
     def validate_for_mye(self, asin: str, listing_data: Dict) -> Dict:
         """
@@ -119,6 +425,54 @@ class LQSIntegration:
 
         return validation
 
+    def is_eligible_quick(self, asin: str, listing_data: Dict) -> bool:
+        """
+        Decide MYE eligibility without always scoring every dimension
+
+        Scores dimensions in descending weight order, tracking the best
+        LQS still achievable; stops as soon as the threshold can no
+        longer be reached (or is already cleared). Use this in triage
+        loops where only the boolean matters — validate_for_mye stays
+        the full API for reports and recommendations.
+
+        Args:
+            asin: Amazon ASIN
+            listing_data: Dict with title, bullets, description
+
+        Returns:
+            True if the listing clears MYE_THRESHOLD
+        """
+        title = listing_data.get("title", "")
+        bullets = listing_data.get("bullets", [])
+        counts = self._keyword_counts(title, bullets)
+        features = {
+            "title": title,
+            "title_len": len(title),
+            "bullet_total_len": sum(map(len, bullets))
+        }
+
+        # Heaviest weights first so accumulated score and achievable
+        # ceiling converge on a decision as early as possible
+        score_plan = (
+            (0.25, lambda: self._score_keyword_optimization(features)),
+            (0.20, lambda: self._score_usp_effectiveness(counts["usp"])),
+            (0.15, lambda: self._score_readability(features)),
+            (0.15, lambda: self._score_competitive_position(asin, listing_data)),
+            (0.15, lambda: self._score_customer_alignment(counts["pain"])),
+            (0.10, lambda: self._score_compliance(counts["banned"]))
+        )
+
+        acc = 0.0
+        remaining = 1.0
+        for weight, score_fn in score_plan:
+            acc += weight * score_fn()
+            remaining -= weight
+            if acc >= self.MYE_THRESHOLD:
+                return True
+            if acc + 100.0 * remaining < self.MYE_THRESHOLD:
+                return False
+        return acc >= self.MYE_THRESHOLD
+
     def get_listing_from_s3(self, asin: str) -> Optional[Dict]:
         """
         Fetch listing data from S3 bucket
@@ -132,67 +486,96 @@ class LQSIntegration:
         try:
             key = f"{self.s3_prefix}{asin}.json"
             response = self.s3_client.get_object(Bucket=self.s3_bucket, Key=key)
-            data = json.loads(response['Body'].read().decode('utf-8'))
+            data = orjson.loads(response['Body'].read())
             return data
         except Exception as e:
             print(f"Error fetching listing from S3: {e}")
             return None
 
-    def _score_keyword_optimization(self, listing_data: Dict) -> float:
+    # Concurrent GETs per batched S3 fetch
+    S3_FETCH_CONCURRENCY = 16
+
+    async def get_listings_from_s3(self, asins: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch listing data for many ASINs concurrently from S3
+
+        Fires up to S3_FETCH_CONCURRENCY GETs at once through one shared
+        async client, so a batch of N listings costs ~ceil(N/16) round-trips
+        of wall time instead of N sequential ones.
+
+        Args:
+            asins: Amazon ASINs to fetch
+
+        Returns:
+            Dict mapping each ASIN to its listing data (None if not found)
+        """
+        semaphore = asyncio.Semaphore(self.S3_FETCH_CONCURRENCY)
+        session = aioboto3.Session()
+
+        async with session.client(
+            's3',
+            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+            region_name=_config().aws_region
+        ) as s3:
+            async def fetch(asin: str):
+                async with semaphore:
+                    try:
+                        key = f"{self.s3_prefix}{asin}.json"
+                        response = await s3.get_object(Bucket=self.s3_bucket, Key=key)
+                        body = await response['Body'].read()
+                        return asin, orjson.loads(body)
+                    except Exception as e:
+                        print(f"Error fetching listing from S3: {e}")
+                        return asin, None
+
+            results = await asyncio.gather(*(fetch(asin) for asin in asins))
+
+        return dict(results)
+
+    def get_listings_from_s3_sync(self, asins: List[str]) -> Dict[str, Optional[Dict]]:
+        """Synchronous wrapper around get_listings_from_s3"""
+        return asyncio.run(self.get_listings_from_s3(asins))
+
+    def _score_keyword_optimization(self, features: Dict) -> float:
         """
         Score keyword optimization (25% weight)
         Coverage + strategic placement
         """
-        title = listing_data.get("title", "")
-        bullets = listing_data.get("bullets", [])
-
         # Simple scoring based on keyword density and placement
         score = 0
 
         # Title keyword placement (50% of dimension)
-        if len(title) > 80 and len(title) <= 200:
+        if 80 < features["title_len"] <= 200:
             score += 50
 
         # Bullet keyword coverage (50% of dimension)
-        total_bullet_length = sum(len(b) for b in bullets)
-        if total_bullet_length > 500:
+        if features["bullet_total_len"] > 500:
             score += 50
 
         return min(100, score)
 
-    def _score_usp_effectiveness(self, listing_data: Dict) -> float:
+    def _score_usp_effectiveness(self, usp_count: int) -> float:
         """
         Score USP effectiveness (20% weight)
         Coverage + differentiation + proof strength
         """
-        bullets = listing_data.get("bullets", [])
-
-        # Check for USP indicators
-        usp_keywords = ["unique", "patented", "exclusive", "only", "first", "proven"]
-        usp_count = sum(
-            1 for bullet in bullets
-            for keyword in usp_keywords
-            if keyword.lower() in bullet.lower()
-        )
-
         return min(100, usp_count * 20 + 40)
 
-    def _score_readability(self, listing_data: Dict) -> float:
+    def _score_readability(self, features: Dict) -> float:
         """
         Score readability (15% weight)
         Flesch score + scannability + title clarity
         """
-        title = listing_data.get("title", "")
-
         # Simple readability check
         score = 70  # Base score
 
         # Title clarity (not too long, not too short)
-        if 100 <= len(title) <= 180:
+        if 100 <= features["title_len"] <= 180:
             score += 15
 
         # Check for clear formatting
-        if any(char in title for char in ["|", ",", "-"]):
+        if any(char in features["title"] for char in ["|", ",", "-"]):
             score += 15
 
         return min(100, score)
@@ -205,37 +588,18 @@ class LQSIntegration:
         # Simplified - would need competitor data
         return 70.0
 
-    def _score_customer_alignment(self, listing_data: Dict) -> float:
+    def _score_customer_alignment(self, pain_point_count: int) -> float:
         """
         Score customer alignment (15% weight)
         Intent theme + pain point coverage
         """
-        bullets = listing_data.get("bullets", [])
-
-        # Check for pain point keywords
-        pain_point_keywords = ["solve", "eliminate", "prevent", "avoid", "reduce", "improve"]
-        pain_point_count = sum(
-            1 for bullet in bullets
-            for keyword in pain_point_keywords
-            if keyword.lower() in bullet.lower()
-        )
-
         return min(100, pain_point_count * 15 + 40)
 
-    def _score_compliance(self, listing_data: Dict) -> float:
+    def _score_compliance(self, violations: int) -> float:
         """
         Score compliance (10% weight)
         Banned terms + Amazon formatting
         """
-        title = listing_data.get("title", "")
-        bullets = listing_data.get("bullets", [])
-
-        # Check for banned terms
-        banned_terms = ["#1", "best seller", "free shipping", "100% guarantee"]
-        text = (title + " " + " ".join(bullets)).lower()
-
-        violations = sum(1 for term in banned_terms if term in text)
-
         if violations == 0:
             return 100
         elif violations == 1:
@@ -244,14 +608,10 @@ class LQSIntegration:
             return 60
 
     def _assign_grade(self, lqs: float) -> str:
-        """Assign letter grade based on LQS"""
-        if lqs >= 90:
-            return "A"
-        elif lqs >= 80:
-            return "B"
-        elif lqs >= 70:
-            return "C"
-        elif lqs >= 60:
-            return "D"
-        else:
-            return "F"
+        """Assign letter grade based on LQS
+
+        Accepts a scalar or an ndarray; the batch path gets vectorized
+        grade assignment for free.
+        """
+        grade = self._GRADE_LABELS[np.searchsorted(self._GRADE_BINS, lqs, side='right')]
+        return str(grade) if np.isscalar(lqs) else grade
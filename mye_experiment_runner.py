@@ -2,13 +2,34 @@
 MYE Experiment Runner
 Orchestrates the full flow: LQS validation -> MYE experiment creation -> Results collection
 """
-import json
+import fcntl
+import logging
+import orjson
 import os
-from typing import Dict, List
+import time
+from typing import Dict, List, Optional
 from datetime import datetime
 from amazon_mye_automation import AmazonMYEAutomation
 from lqs_integration import LQSIntegration
 
+logger = logging.getLogger("mye_runner")
+
+
+def _atomic_write_json(path: str, obj: Dict) -> None:
+    """Serialize obj and write it to path in one syscall, atomically
+
+    Writes the whole orjson-encoded payload with a single os.write to a
+    temp file, then renames over the target, so readers never observe a
+    half-written report and no buffered file object is involved.
+    """
+    tmp_path = path + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
 
 class MYEExperimentRunner:
     """
@@ -22,11 +43,37 @@ class MYEExperimentRunner:
     5. Determine winner and apply
     """
 
-    def __init__(self, headless: bool = False):
+    # Re-login after this long to preempt Amazon's session timeout
+    SESSION_MAX_AGE = 25 * 60  # seconds
+
+    def __init__(self, headless: bool = True):
         self.lqs = LQSIntegration()
         self.headless = headless
         self.experiments_dir = "experiments"
         os.makedirs(self.experiments_dir, exist_ok=True)
+        self._mye = None
+        self._mye_login_ts = 0.0
+
+    def _mye_session(self) -> AmazonMYEAutomation:
+        """Return a logged-in automation session, reused across calls
+
+        Login is dominated by page loads and (potentially) 2FA, so daily
+        monitoring loops keep one session alive instead of paying that cost
+        on every metrics poll. Expired sessions are torn down and rebuilt.
+        """
+        if self._mye is None or time.time() - self._mye_login_ts > self.SESSION_MAX_AGE:
+            self.close()
+            self._mye = AmazonMYEAutomation(headless=self.headless)
+            self._mye.__enter__()
+            self._mye.login()
+            self._mye_login_ts = time.time()
+        return self._mye
+
+    def close(self) -> None:
+        """Shut down the cached browser session, if any"""
+        if self._mye is not None:
+            self._mye.__exit__(None, None, None)
+            self._mye = None
 
     def run_experiment(self,
                       asin: str,
@@ -45,12 +92,10 @@ class MYEExperimentRunner:
         Returns:
             Experiment results dict
         """
-        print(f"\n{'='*60}")
-        print(f"MYE Experiment Runner - ASIN {asin}")
-        print(f"{'='*60}\n")
+        logger.info("MYE Experiment Runner - ASIN %s", asin)
 
         # Step 1: Validate treatment with LQS
-        print("Step 1: Validating treatment listing with LQS...")
+        logger.info("Step 1: Validating treatment listing with LQS...")
         treatment_data = {
             "title": treatment_title,
             "bullets": [],  # Title-only test
@@ -59,32 +104,30 @@ class MYEExperimentRunner:
 
         lqs_validation = self.lqs.validate_for_mye(asin, treatment_data)
 
-        print(f"  LQS Score: {lqs_validation['lqs']}/100")
-        print(f"  Grade: {lqs_validation['grade']}")
-        print(f"  MYE Eligible: {lqs_validation['eligible']}")
+        logger.info("  LQS Score: %s/100", lqs_validation["lqs"])
+        logger.info("  Grade: %s", lqs_validation["grade"])
+        logger.info("  MYE Eligible: %s", lqs_validation["eligible"])
 
         if not lqs_validation["eligible"]:
-            print("\n❌ Treatment listing FAILS MYE eligibility check")
-            print("Blockers:")
+            logger.warning("Treatment listing FAILS MYE eligibility check")
             for blocker in lqs_validation["blockers"]:
-                print(f"  - {blocker}")
-            print("\nRecommendations:")
+                logger.warning("  Blocker: %s", blocker)
             for rec in lqs_validation["recommendations"]:
-                print(f"  - {rec}")
+                logger.info("  Recommendation: %s", rec)
             return {
                 "status": "BLOCKED",
                 "reason": "LQS below MYE threshold",
                 "lqs_validation": lqs_validation
             }
 
-        print("✓ Treatment listing passes MYE eligibility check\n")
+        logger.info("Treatment listing passes MYE eligibility check")
 
         # Step 2: Create MYE experiment
-        print("Step 2: Creating MYE experiment in Seller Central...")
+        logger.info("Step 2: Creating MYE experiment in Seller Central...")
 
         with AmazonMYEAutomation(headless=self.headless) as mye:
             # Login
-            print("  Logging in to Seller Central...")
+            logger.info("  Logging in to Seller Central...")
             mye.login()
 
             # Create experiment
@@ -96,7 +139,7 @@ class MYEExperimentRunner:
                 duration_days=duration_days
             )
 
-            print(f"✓ Experiment created: {experiment_metadata['experiment_id']}\n")
+            logger.info("Experiment created: %s", experiment_metadata["experiment_id"])
 
             # Save experiment metadata
             self._save_experiment(experiment_metadata, lqs_validation)
@@ -118,29 +161,70 @@ class MYEExperimentRunner:
         Returns:
             Metrics dict
         """
-        print(f"\nCollecting metrics for experiment {experiment_id}...")
+        logger.info("Collecting metrics for experiment %s...", experiment_id)
 
-        with AmazonMYEAutomation(headless=self.headless) as mye:
-            mye.login()
-            metrics = mye.get_experiment_metrics(experiment_id)
+        mye = self._mye_session()
+        metrics = mye.get_experiment_metrics(experiment_id)
 
-            # Determine winner
-            analysis = mye.determine_winner(metrics)
+        # Determine winner
+        analysis = mye.determine_winner(metrics)
 
-            print(f"Control CTR: {metrics['control']['ctr']}%")
-            print(f"Treatment CTR: {metrics['treatment']['ctr']}%")
-            print(f"CTR Lift: {analysis['ctr_lift_percent']}%")
-            print(f"Winner: {analysis['winner']}")
-            print(f"Recommendation: {analysis['recommendation']}")
+        logger.info("Control CTR: %s%%", metrics["control"]["ctr"])
+        logger.info("Treatment CTR: %s%%", metrics["treatment"]["ctr"])
+        logger.info("CTR Lift: %s%%", analysis["ctr_lift_percent"])
+        logger.info("Winner: %s", analysis["winner"])
+        logger.info("Recommendation: %s", analysis["recommendation"])
 
-            # Save metrics
-            self._save_metrics(experiment_id, metrics, analysis)
+        # Save metrics
+        self._save_metrics(experiment_id, metrics, analysis)
 
-            return {
+        return {
+            "metrics": metrics,
+            "analysis": analysis
+        }
+
+    def collect_metrics_batch(self, experiment_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Collect metrics for many experiments with minimal round-trips
+
+        Scrapes the experiments dashboard once and joins it against the
+        requested IDs, so unknown experiments cost nothing instead of a
+        doomed page load each. The remaining detail fetches share this
+        runner's logged-in session and, after the first, MYE's captured
+        JSON metrics endpoint rather than full page navigations.
+
+        Args:
+            experiment_ids: MYE experiment IDs to collect
+
+        Returns:
+            Dict mapping each ID to {"metrics", "analysis"}, or None for
+            IDs not present on the dashboard
+        """
+        mye = self._mye_session()
+
+        # One dashboard round-trip identifies which experiments exist
+        known_ids = {
+            row["experiment_id"] for row in mye.get_all_experiments()
+            if row.get("experiment_id")
+        }
+
+        results: Dict[str, Optional[Dict]] = {}
+        for experiment_id in experiment_ids:
+            if experiment_id not in known_ids:
+                logger.warning("Experiment %s not found on dashboard", experiment_id)
+                results[experiment_id] = None
+                continue
+
+            metrics = mye.get_experiment_metrics(experiment_id)
+            analysis = mye.determine_winner(metrics)
+            self._save_metrics(experiment_id, metrics, analysis)
+            results[experiment_id] = {
                 "metrics": metrics,
                 "analysis": analysis
             }
 
+        return results
+
     def list_experiments(self) -> List[Dict]:
         """
         List all experiments
@@ -148,10 +232,8 @@ class MYEExperimentRunner:
         Returns:
             List of experiment metadata
         """
-        with AmazonMYEAutomation(headless=self.headless) as mye:
-            mye.login()
-            experiments = mye.get_all_experiments()
-            return experiments
+        mye = self._mye_session()
+        return mye.get_all_experiments()
 
     def generate_report(self, experiment_id: str) -> Dict:
         """
@@ -163,15 +245,15 @@ class MYEExperimentRunner:
         Returns:
             Report dict
         """
-        # Load experiment data
-        experiment_file = os.path.join(self.experiments_dir, f"{experiment_id}.json")
+        # Load experiment data; open directly rather than stat-then-open
+        experiment_file = self._meta_path(experiment_id)
 
-        if not os.path.exists(experiment_file):
+        try:
+            with open(experiment_file, "rb") as f:
+                data = orjson.loads(f.read())
+        except FileNotFoundError:
             return {"error": f"Experiment {experiment_id} not found"}
 
-        with open(experiment_file, "r") as f:
-            data = json.load(f)
-
         # Collect latest metrics
         latest_metrics = self.collect_metrics(experiment_id)
 
@@ -185,62 +267,80 @@ class MYEExperimentRunner:
             "treatment_title": data["metadata"]["treatment_text"],
             "metrics": latest_metrics["metrics"],
             "analysis": latest_metrics["analysis"],
+            "metrics_history": list(self._iter_metrics_history(experiment_id)),
             "recommendation": latest_metrics["analysis"]["recommendation"],
             "generated_at": datetime.now().isoformat()
         }
 
         # Save report
         report_file = os.path.join(self.experiments_dir, f"{experiment_id}_report.json")
-        with open(report_file, "w") as f:
-            json.dump(report, f, indent=2)
+        _atomic_write_json(report_file, report)
 
-        print(f"\n✓ Report saved: {report_file}")
+        logger.info("Report saved: %s", report_file)
 
         return report
 
+    def _meta_path(self, experiment_id: str) -> str:
+        """Path of the immutable per-experiment metadata file"""
+        return os.path.join(self.experiments_dir, f"{experiment_id}.meta.json")
+
+    def _metrics_log_path(self, experiment_id: str) -> str:
+        """Path of the append-only per-experiment metrics log"""
+        return os.path.join(self.experiments_dir, f"{experiment_id}.metrics.jsonl")
+
     def _save_experiment(self, metadata: Dict, lqs_validation: Dict) -> None:
-        """Save experiment metadata to file"""
+        """Save experiment metadata to file (written once, never rewritten)"""
         experiment_id = metadata["experiment_id"]
-        filepath = os.path.join(self.experiments_dir, f"{experiment_id}.json")
+        filepath = self._meta_path(experiment_id)
 
         data = {
             "metadata": metadata,
-            "lqs_validation": lqs_validation,
-            "metrics_history": []
+            "lqs_validation": lqs_validation
         }
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        _atomic_write_json(filepath, data)
 
-        print(f"  Experiment data saved: {filepath}")
+        logger.info("  Experiment data saved: %s", filepath)
 
     def _save_metrics(self, experiment_id: str, metrics: Dict, analysis: Dict) -> None:
-        """Append metrics to experiment file"""
-        filepath = os.path.join(self.experiments_dir, f"{experiment_id}.json")
+        """Append one metrics entry to the experiment's JSONL log
 
-        if not os.path.exists(filepath):
-            print(f"Warning: Experiment file not found: {filepath}")
-            return
-
-        with open(filepath, "r") as f:
-            data = json.load(f)
+        O(1) append under an exclusive lock instead of reading and
+        rewriting the whole history; a crash can at worst truncate the
+        final line instead of corrupting accumulated data.
+        """
+        filepath = self._metrics_log_path(experiment_id)
 
-        # Append metrics
-        data["metrics_history"].append({
+        entry = {
             "collected_at": datetime.now().isoformat(),
             "metrics": metrics,
             "analysis": analysis
-        })
-
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        }
 
-        print(f"  Metrics saved to: {filepath}")
+        with open(filepath, "ab") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.write(orjson.dumps(entry) + b"\n")
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+        logger.info("  Metrics saved to: %s", filepath)
+
+    def _iter_metrics_history(self, experiment_id: str):
+        """Stream metrics entries from the JSONL log, oldest first"""
+        try:
+            with open(self._metrics_log_path(experiment_id), "rb") as f:
+                for line in f:
+                    if line.strip():
+                        yield orjson.loads(line)
+        except FileNotFoundError:
+            return
 
 
 def main():
     """Example usage"""
-    runner = MYEExperimentRunner(headless=False)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    runner = MYEExperimentRunner()
 
     # Example: Run experiment
     result = runner.run_experiment(
@@ -14,13 +14,23 @@ from lqs_integration import LQSIntegration
 from mye_experiment_runner import MYEExperimentRunner
 
 
+@pytest.fixture(scope="session")
+def lqs():
+    """One LQSIntegration (and S3 client) shared across the session"""
+    return LQSIntegration()
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """One MYEExperimentRunner shared across the session"""
+    return MYEExperimentRunner(headless=True)
+
+
 class TestLQSIntegration:
     """Test LQS integration and validation"""
 
-    def test_lqs_calculation(self):
+    def test_lqs_calculation(self, lqs):
         """1. Test LQS score calculation"""
-        lqs = LQSIntegration()
-
         listing_data = {
             "title": "Premium Wireless Headphones with Noise Cancellation | 40Hr Battery | Comfortable Design",
             "bullets": [
@@ -40,10 +50,8 @@ class TestLQSIntegration:
         assert "dimensions" in result
         assert len(result["dimensions"]) == 6
 
-    def test_mye_eligibility_pass(self):
+    def test_mye_eligibility_pass(self, lqs):
         """2. Test MYE eligibility validation - passing"""
-        lqs = LQSIntegration()
-
         # High-quality listing
         listing_data = {
             "title": "Premium Wireless Headphones | Noise Cancelling | 40Hr Battery | Comfortable Design for Travel",
@@ -63,10 +71,8 @@ class TestLQSIntegration:
         assert validation["eligible"] is True
         assert validation["grade"] in ["A", "B", "C"]
 
-    def test_mye_eligibility_fail(self):
+    def test_mye_eligibility_fail(self, lqs):
         """3. Test MYE eligibility validation - failing"""
-        lqs = LQSIntegration()
-
         # Low-quality listing
         listing_data = {
             "title": "Headphones",
@@ -80,10 +86,8 @@ class TestLQSIntegration:
         assert validation["eligible"] is False
         assert len(validation["blockers"]) > 0
 
-    def test_dimension_weights_sum_to_100(self):
+    def test_dimension_weights_sum_to_100(self, lqs):
         """4. Test dimension weights sum to 100%"""
-        lqs = LQSIntegration()
-
         listing_data = {
             "title": "Test Title",
             "bullets": [],
@@ -98,6 +102,52 @@ class TestLQSIntegration:
 
         assert abs(total_weight - 1.0) < 0.01  # Allow for floating point rounding
 
+    def test_batch_lqs_matches_scalar(self, lqs):
+        """calculate_lqs_batch returns exactly the scalar results"""
+        asins = ["B01BATCH1", "B01BATCH2", "B01BATCH3"]
+        listings = [
+            {
+                "title": "Premium Wireless Headphones | Noise Cancelling | 40Hr Battery | Comfortable Design",
+                "bullets": [
+                    "Advanced noise cancellation eliminates background noise",
+                    "40-hour battery life for extended use",
+                    "Comfortable over-ear design for all-day wear"
+                ],
+                "description": "Experience premium audio..."
+            },
+            {"title": "Headphones", "bullets": ["Good sound"], "description": ""},
+            {"title": "", "bullets": [], "description": ""}
+        ]
+
+        expected = [
+            lqs.calculate_lqs(asin, listing)
+            for asin, listing in zip(asins, listings)
+        ]
+
+        assert lqs.calculate_lqs_batch(asins, listings) == expected
+        assert lqs.calculate_lqs_batch([], []) == []
+
+    def test_lqs_cache_hit_isolation_and_invalidate(self, lqs):
+        """Cached LQS results are reused, mutation-safe and evictable"""
+        listing_data = {
+            "title": "Cache Test Title for Repeated Scoring",
+            "bullets": ["First bullet", "Second bullet"],
+            "description": ""
+        }
+
+        first = lqs.calculate_lqs("B01CACHE", listing_data)
+        second = lqs.calculate_lqs("B01CACHE", listing_data)
+        assert second == first
+
+        # Mutating a returned dict must not poison the cache
+        second["lqs"] = -1.0
+        assert lqs.calculate_lqs("B01CACHE", listing_data) == first
+
+        lqs.invalidate("B01CACHE")
+        assert all(entry.asin != "B01CACHE" for entry in lqs._lqs_cache.values())
+        # A recompute after invalidation still yields the same score
+        assert lqs.calculate_lqs("B01CACHE", listing_data) == first
+
 
 class TestAmazonMYEAutomation:
     """Test Amazon Seller Central automation"""
@@ -182,14 +232,73 @@ class TestAmazonMYEAutomation:
         assert analysis["ctr_lift_percent"] == -20.0  # 20% decline
         assert analysis["recommendation"] == "ROLLBACK"
 
+    def test_winners_batch_matches_scalar(self):
+        """determine_winners_batch returns exactly the scalar analyses"""
+        mye = AmazonMYEAutomation(headless=True)
+
+        metrics_list = [
+            {
+                "control": {"impressions": 10000, "clicks": 200, "ctr": 2.0,
+                            "units_ordered": 20, "cvr": 10.0},
+                "treatment": {"impressions": 10000, "clicks": 250, "ctr": 2.5,
+                              "units_ordered": 30, "cvr": 12.0}
+            },
+            {
+                "control": {"impressions": 10000, "clicks": 250, "ctr": 2.5,
+                            "units_ordered": 30, "cvr": 12.0},
+                "treatment": {"impressions": 10000, "clicks": 200, "ctr": 2.0,
+                              "units_ordered": 20, "cvr": 10.0}
+            },
+            {
+                # Degenerate: no traffic at all
+                "control": {"impressions": 0, "clicks": 0, "ctr": 0,
+                            "units_ordered": 0, "cvr": 0},
+                "treatment": {"impressions": 0, "clicks": 0, "ctr": 0,
+                              "units_ordered": 0, "cvr": 0}
+            }
+        ]
+
+        expected = [mye.determine_winner(m) for m in metrics_list]
+
+        assert mye.determine_winners_batch(metrics_list) == expected
+        assert mye.determine_winners_batch([]) == []
+
+    def test_batch_analyze_matches_scalar(self):
+        """batch_analyze confidence agrees with the scalar chi-squared test"""
+        mye = AmazonMYEAutomation(headless=True)
+
+        metrics_list = [
+            {
+                "experiment_id": "EXP_A",
+                "control": {"impressions": 10000, "clicks": 200, "ctr": 2.0,
+                            "units_ordered": 20, "cvr": 10.0},
+                "treatment": {"impressions": 10000, "clicks": 320, "ctr": 3.2,
+                              "units_ordered": 40, "cvr": 12.5}
+            },
+            {
+                "experiment_id": "EXP_B",
+                "control": {"impressions": 500, "clicks": 10, "ctr": 2.0,
+                            "units_ordered": 1, "cvr": 10.0},
+                "treatment": {"impressions": 500, "clicks": 11, "ctr": 2.2,
+                              "units_ordered": 1, "cvr": 9.1}
+            }
+        ]
+
+        results = mye.batch_analyze(metrics_list)
+
+        assert [r["experiment_id"] for r in results] == ["EXP_A", "EXP_B"]
+        for metrics, result in zip(metrics_list, results):
+            assert result["confidence"] == mye._calculate_statistical_significance(
+                metrics["control"], metrics["treatment"]
+            )
+        assert mye.batch_analyze([]) == []
+
 
 class TestMYEExperimentRunner:
     """Test end-to-end experiment runner"""
 
-    def test_experiment_blocked_by_lqs(self):
+    def test_experiment_blocked_by_lqs(self, runner):
         """9. Test experiment blocked by low LQS"""
-        runner = MYEExperimentRunner(headless=True)
-
         result = runner.run_experiment(
             asin="B01TEST",
             control_title="Old Title",